@@ -0,0 +1,188 @@
+import sys
+import tracemalloc
+from array import array
+
+# tipos de entidad, 0 marca un id libre
+FREE = 0
+BIRD = 1
+PIG = 2
+COLUMN = 3
+EXPLOSION = 4
+
+# bits del arreglo de flags
+HAS_ABILITY = 1
+ABILITY_USED = 2
+BOOST_APPLIED = 4
+
+
+class EntityStore:
+    """
+    Struct-of-arrays store for game entities. Kind, ability flags and
+    explosion radius live in typed arrays indexed by entity id. The pymunk
+    body stays on the sprite, which owns it. Ids of removed entities are
+    reused; the generation of an id changes every time it is freed, so
+    views of the old entity can tell they are stale.
+    """
+    def __init__(self):
+        self.kind = array("B")
+        self.flags = array("B")
+        self.radius = array("f")
+        self.generation = array("I")
+        self._free = []
+
+    def add(self, kind: int, flags: int = 0, radius: float = 0.0) -> int:
+        if self._free:
+            entity_id = self._free.pop()
+            self.kind[entity_id] = kind
+            self.flags[entity_id] = flags
+            self.radius[entity_id] = radius
+            return entity_id
+        self.kind.append(kind)
+        self.flags.append(flags)
+        self.radius.append(radius)
+        self.generation.append(0)
+        return len(self.kind) - 1
+
+    def remove(self, entity_id: int):
+        if self.kind[entity_id] == FREE:
+            return
+        self.kind[entity_id] = FREE
+        self.generation[entity_id] = (self.generation[entity_id] + 1) & 0xFFFFFFFF
+        self._free.append(entity_id)
+
+    def view(self, entity_id: int) -> "Entity":
+        return Entity(self, entity_id)
+
+    def count(self, kind: int) -> int:
+        return self.kind.count(kind)
+
+    def __len__(self):
+        return len(self.kind) - len(self._free)
+
+
+class Entity:
+    """
+    Thin view over one row of an EntityStore. Reading or writing through a
+    view whose entity was released raises LookupError
+    """
+    __slots__ = ("store", "id", "generation")
+
+    def __init__(self, store: EntityStore, entity_id: int):
+        self.store = store
+        self.id = entity_id
+        self.generation = store.generation[entity_id]
+
+    def _row(self) -> int:
+        if self.store.generation[self.id] != self.generation:
+            raise LookupError(f"entity {self.id} was released")
+        return self.id
+
+    @property
+    def kind(self) -> int:
+        return self.store.kind[self._row()]
+
+    @property
+    def explosion_radius(self) -> float:
+        return self.store.radius[self._row()]
+
+    @explosion_radius.setter
+    def explosion_radius(self, value: float):
+        self.store.radius[self._row()] = value
+
+    def _get_flag(self, flag: int) -> bool:
+        return bool(self.store.flags[self._row()] & flag)
+
+    def _set_flag(self, flag: int, value: bool):
+        row = self._row()
+        if value:
+            self.store.flags[row] |= flag
+        else:
+            self.store.flags[row] &= ~flag & 0xFF
+
+    has_special_ability = property(
+        lambda self: self._get_flag(HAS_ABILITY),
+        lambda self, value: self._set_flag(HAS_ABILITY, value),
+    )
+    ability_used = property(
+        lambda self: self._get_flag(ABILITY_USED),
+        lambda self, value: self._set_flag(ABILITY_USED, value),
+    )
+    speed_boost_applied = property(
+        lambda self: self._get_flag(BOOST_APPLIED),
+        lambda self, value: self._set_flag(BOOST_APPLIED, value),
+    )
+
+    @property
+    def alive(self) -> bool:
+        return self.store.generation[self.id] == self.generation
+
+    def release(self):
+        if self.alive:
+            self.store.remove(self.id)
+
+
+def _measure(build) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return size
+
+
+def memory_report(n: int = 100_000):
+    """
+    Print the bytes per entity for n entities, as the game allocates them
+    now (Sprite + Entity view + store row) and as it did before (Sprite with
+    the ability attributes in its __dict__), plus a bare store row for
+    reference. Pymunk bodies are left out since every variant keeps one.
+    While arcade needs a Sprite per object the view and row come on top of
+    it, so the game objects can not get smaller; only a bare row is.
+    """
+    def build_rows():
+        soa = EntityStore()
+        for _ in range(n):
+            soa.add(BIRD, flags=HAS_ABILITY, radius=150)
+        return soa
+
+    rows = []
+    try:
+        import arcade
+    except ImportError:
+        print("arcade no esta instalado, solo se mide la fila del store", file=sys.stderr)
+    else:
+        texture = arcade.load_texture("assets/img/bomb.png")
+
+        def build_game_objects():
+            soa = EntityStore()
+            sprites = []
+            for _ in range(n):
+                sprite = arcade.Sprite(texture)
+                sprite.entity = soa.view(soa.add(BIRD, flags=HAS_ABILITY, radius=150))
+                sprites.append(sprite)
+            return soa, sprites
+
+        def build_old_objects():
+            sprites = []
+            for _ in range(n):
+                sprite = arcade.Sprite(texture)
+                sprite.has_special_ability = True
+                sprite.ability_used = False
+                sprite.explosion_radius = 150
+                sprites.append(sprite)
+            return sprites
+
+        rows.append(("Sprite + view + fila (actual)", _measure(build_game_objects)))
+        rows.append(("Sprite + atributos (antes)", _measure(build_old_objects)))
+
+    rows.append(("Solo fila del store", _measure(build_rows)))
+
+    print(f"Memoria por entidad con {n} entidades (sin cuerpos de pymunk)")
+    for name, size in rows:
+        print(f"  {name:<30} {size / n:8.1f} bytes")
+
+
+if __name__ == "__main__":
+    memory_report()
@@ -0,0 +1,122 @@
+import struct
+import sys
+import time
+
+# tipos de evento
+LAUNCH = 1  # entity: id, detail: tipo, a/b: angulo e impulso
+ABILITY = 2  # entity: id, detail: tipo, a/b: posicion
+KILL = 3  # entity: id, detail: tipo de entidad destruida, a/b: posicion
+REMOVAL = 4  # entity: id, detail: razon (REASONS), a/b: posicion
+LEVEL_END = 5  # detail: 1 si gano, a: puntaje
+
+EVENT_NAMES = {
+    LAUNCH: "launch",
+    ABILITY: "ability",
+    KILL: "kill",
+    REMOVAL: "removal",
+    LEVEL_END: "level_end",
+}
+REASONS = {"expired": 0, "out of bounds": 1, "at rest": 2}
+
+# frame, tiempo, evento, entity, detail, a, b
+RECORD = struct.Struct("<IdBIBff")
+MAGIC = b"ABTR"
+HEADER = struct.Struct("<4sII")  # magic, tamaño de registro, cantidad
+
+
+class EventTrace:
+    """
+    Preallocated ring buffer of binary game events. Recording packs one
+    fixed-size record into the buffer, with no formatting or I/O, and the
+    oldest records are overwritten once it is full. dump() writes the
+    records in order to a file that read_trace() can load back.
+    """
+    def __init__(self, capacity: int = 65536):
+        self.capacity = capacity
+        self.frame = 0
+        self._buffer = bytearray(RECORD.size * capacity)
+        self._next = 0  # cantidad total de eventos grabados
+
+    def record(self, event: int, entity: int = 0, detail: int = 0, a: float = 0.0, b: float = 0.0):
+        offset = (self._next % self.capacity) * RECORD.size
+        RECORD.pack_into(
+            self._buffer, offset, self.frame, time.perf_counter(), event, entity, detail, a, b
+        )
+        self._next += 1
+
+    def __len__(self):
+        return min(self._next, self.capacity)
+
+    def records(self):
+        """Return the recorded events from oldest to newest"""
+        count = len(self)
+        start = self._next - count
+        return [
+            RECORD.unpack_from(self._buffer, ((start + i) % self.capacity) * RECORD.size)
+            for i in range(count)
+        ]
+
+    def dump(self, path: str):
+        count = len(self)
+        split = (self._next % self.capacity) * RECORD.size
+        view = memoryview(self._buffer)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, RECORD.size, count))
+            if count == self.capacity:  # el buffer dio la vuelta
+                f.write(view[split:])
+            f.write(view[:split])
+
+    def install_crash_dump(self, path: str):
+        """Dump the trace to path if the game dies with an uncaught exception"""
+        previous_hook = sys.excepthook
+
+        def hook(exc_type, exc, tb):
+            try:
+                self.dump(path)
+            finally:
+                previous_hook(exc_type, exc, tb)
+
+        sys.excepthook = hook
+
+
+def read_trace(path: str):
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError(f"{path} no es un archivo de trace valido")
+        magic, size, count = HEADER.unpack(header)
+        if magic != MAGIC or size != RECORD.size:
+            raise ValueError(f"{path} no es un archivo de trace valido")
+        data = f.read(size * count)
+    if len(data) != size * count:
+        raise ValueError(f"{path} esta incompleto: se esperaban {count} eventos")
+    return [RECORD.unpack_from(data, i * size) for i in range(count)]
+
+
+def main():
+    # uso: python event_trace.py trace.bin
+    if len(sys.argv) != 2:
+        print("uso: python event_trace.py <archivo>", file=sys.stderr)
+        sys.exit(1)
+    events = read_trace(sys.argv[1])
+    if not events:
+        print("trace vacio")
+        return
+
+    start = events[0][1]
+    counts = {}
+    for frame, timestamp, event, entity, detail, a, b in events:
+        name = EVENT_NAMES.get(event, str(event))
+        counts[name] = counts.get(name, 0) + 1
+        print(
+            f"{frame:8d} {timestamp - start:10.4f}s {name:<10} {entity:8d} {detail:3d}"
+            f" {a:10.2f} {b:10.2f}"
+        )
+
+    print()
+    for name, count in counts.items():
+        print(f"{name:<10} {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import math
 import arcade
 import pymunk
 from game_logic import ImpulseVector
+from entities import EntityStore, BIRD, PIG, COLUMN, EXPLOSION
 
 #hice anotaciones al lado del codigo para entender bien lo que hace. Si es que usé cosas
 #no vistas en clase, las comenté para saber que es lo que hace
@@ -17,6 +18,7 @@ class Bird(arcade.Sprite): #pajaro rojo
         x: float,
         y: float,
         space: pymunk.Space,
+        store: EntityStore,
         mass: float = 5,
         radius: float = 12,
         max_impulse: float = 100,
@@ -46,10 +48,10 @@ class Bird(arcade.Sprite): #pajaro rojo
 
         self.body = body
         self.shape = shape
-        self.has_special_ability = False
-        self.ability_used = False
+        self.entity = store.view(store.add(BIRD))  # estado de habilidad en el store
     def use_special_ability(self, space, sprites_list):
-        pass
+        # devuelve los sprites nuevos que agrego la habilidad
+        return []
     def update(self, delta_time):
         """
         Update the position of the bird sprite based on the physics body position
@@ -60,36 +62,41 @@ class Bird(arcade.Sprite): #pajaro rojo
 
 class RedBird(Bird):
     
-    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space):
+    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space,
+                 store: EntityStore):
         super().__init__(
             image_path="assets/img/red-bird3.png",
             impulse_vector=impulse_vector,
             x=x,
             y=y,
             space=space,
+            store=store,
             mass=5,
             radius=12,
             scale=1.5
         )
 class BlueBird(Bird):
     """Pájaro azul - se divide en 3 pájaros más pequeños"""
-    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space):
+    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space,
+                 store: EntityStore):
         super().__init__(
             image_path="assets/img/blue.png",
             impulse_vector=impulse_vector,
             x=x,
             y=y,
             space=space,
+            store=store,
             mass=4,  # mas ligero
             radius=10,
             scale=0.3
         )
-        self.has_special_ability = True
+        self.entity.has_special_ability = True
     def use_special_ability(self, space, sprites_list):
-        if not self.ability_used:
-            self.ability_used = True
+        if not self.entity.ability_used:
+            self.entity.ability_used = True
             current_pos = pymunk.Vec2d(self.center_x, self.center_y)
             current_velocity = self.body.velocity
+            new_birds = []
             
             # 3 pájaros azules más pequeños
             for i in range(3):
@@ -101,84 +108,96 @@ class BlueBird(Bird):
                     ImpulseVector(0, 0),
                     current_pos.x,
                     current_pos.y,
-                    space
+                    space,
+                    self.entity.store
                 )
                 
                 new_bird.body.velocity = new_velocity
                 
                 sprites_list.append(new_bird)
+                new_birds.append(new_bird)
+            return new_birds
+        return []
 
 
 class BlueBirdSplit(Bird):
     """Versión más pequeña del pájaro azul para la habilidad especial"""
-    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space):
+    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space,
+                 store: EntityStore):
         super().__init__(
             image_path="assets/img/blue.png",
             impulse_vector=impulse_vector,
             x=x,
             y=y,
             space=space,
+            store=store,
             mass=2,  
             radius=6,  
             scale=0.2
         )
 class ChuckBird(Bird):
-    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space):
+    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space,
+                 store: EntityStore):
         super().__init__(
             image_path="assets/img/chuck.png",
             impulse_vector=impulse_vector,
             x=x,
             y=y,
             space=space,
+            store=store,
             mass=4,  # ligero
             radius=11,
             power_multiplier=60,  # más rápido por defecto
             scale=0.08
         )
-        self.has_special_ability = True
-        self.speed_boost_applied = False
+        self.entity.has_special_ability = True
     def use_special_ability(self, space, sprites_list):
-        if not self.ability_used and not self.speed_boost_applied:
-            self.ability_used = True
-            self.speed_boost_applied = True
+        if not self.entity.ability_used and not self.entity.speed_boost_applied:
+            self.entity.ability_used = True
+            self.entity.speed_boost_applied = True
             # + velocidad significativamente
             speed_boost = 1.5  # multiplica velocidad
             current_velocity = self.body.velocity
             self.body.velocity = current_velocity * speed_boost
             
             self.texture = arcade.load_texture("assets/img/chuck.png")
+        return []
 class BombBird(Bird):
-    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space):
+    def __init__(self, impulse_vector: ImpulseVector, x: float, y: float, space: pymunk.Space,
+                 store: EntityStore):
         super().__init__(
             image_path="assets/img/bomb.png",
             impulse_vector=impulse_vector,
             x=x,
             y=y,
             space=space,
+            store=store,
             mass=5,  
             radius=14,
             power_multiplier=40,  
             scale=0.08
         )
-        self.has_special_ability = True
-        self.explosion_radius = 150  
+        self.entity.has_special_ability = True
+        self.entity.explosion_radius = 150
     def use_special_ability(self, space, sprites_list):
-        if not self.ability_used:
-            self.ability_used = True
+        if not self.entity.ability_used:
+            self.entity.ability_used = True
+            explosion_radius = self.entity.explosion_radius
             explosion_point = pymunk.Vec2d(self.center_x, self.center_y)
-            explosion = Explosion(self.center_x, self.center_y)
+            explosion = Explosion(self.center_x, self.center_y, self.entity.store)
             sprites_list.append(explosion)
             for body in space.bodies:
                 if body.body_type == pymunk.Body.DYNAMIC:
                     distance = (body.position - explosion_point).length
-                    if distance < self.explosion_radius:
-                        force = (self.explosion_radius - distance) * 800
+                    if distance < explosion_radius:
+                        force = (explosion_radius - distance) * 800
                         direction = (body.position - explosion_point).normalized()
                         body.apply_impulse_at_world_point(direction * force, body.position)
             self.remove_from_sprite_lists()
             space.remove(self.shape, self.body)
-
-            print("¡BOOM! Explosión del pájaro bomba")
+            self.entity.release()
+            return [explosion]
+        return []
         
         
 class Pig(arcade.Sprite):
@@ -187,6 +206,7 @@ class Pig(arcade.Sprite):
         x: float,
         y: float,
         space: pymunk.Space,
+        store: EntityStore,
         mass: float = 2,
         elasticity: float = 0.8,
         friction: float = 0.4,
@@ -203,23 +223,22 @@ class Pig(arcade.Sprite):
         space.add(body, shape)
         self.body = body
         self.shape = shape
+        self.entity = store.view(store.add(PIG))
 
     def update(self, delta_time):
         self.center_x = self.shape.body.position.x
         self.center_y = self.shape.body.position.y
         self.radians = self.shape.body.angle
 class Explosion(arcade.Sprite):
-    def __init__(self, x: float, y: float):
+    """
+    Explosion effect. It is removed by the LifetimeReaper after duration seconds
+    """
+    def __init__(self, x: float, y: float, store: EntityStore):
         super().__init__("assets/img/explosion.png", 0.3)  
         self.center_x = x
         self.center_y = y
         self.duration = 0.5  
-        self.timer = 0
-
-    def update(self, delta_time):
-        self.timer += delta_time
-        if self.timer >= self.duration:
-            self.remove_from_sprite_lists()
+        self.entity = store.view(store.add(EXPLOSION))
 
 
 class PassiveObject(arcade.Sprite):
@@ -257,8 +276,9 @@ class PassiveObject(arcade.Sprite):
 
 
 class Column(PassiveObject):
-    def __init__(self, x, y, space):
+    def __init__(self, x, y, space, store):
         super().__init__("assets/img/column.png", x, y, space)
+        self.entity = store.view(store.add(COLUMN))
 
 
 class StaticObject(arcade.Sprite):
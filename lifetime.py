@@ -0,0 +1,156 @@
+# acciones que se pueden programar en la rueda
+PROBE = 0  # revisar si el objeto salio del mundo o esta quieto
+SETTLE = 1  # el objeto estaba quieto, confirmar y eliminar
+EXPIRE = 2  # tiempo de vida fijo (explosiones)
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel. Each timer is stored in the slot of its deadline tick,
+    so advancing one tick only looks at the timers of that slot instead of
+    every tracked entity. Delays longer than the wheel wrap around and stay
+    in the slot until their deadline is reached.
+    """
+    def __init__(self, slots: int = 64):
+        self._slots = [[] for _ in range(slots)]
+        self._tick = 0
+        self._deadlines = {}  # entidad -> (deadline, accion)
+
+    def schedule(self, entity, delay: int, action: int):
+        # reprogramar deja la entrada vieja en su slot, se descarta al llegar
+        deadline = self._tick + max(1, int(delay))
+        self._deadlines[entity] = (deadline, action)
+        self._slots[deadline % len(self._slots)].append((deadline, entity))
+
+    def cancel(self, entity):
+        self._deadlines.pop(entity, None)
+
+    def advance(self):
+        """
+        Move the wheel one tick forward and return the (entity, action) pairs
+        that are due on this tick
+        """
+        self._tick += 1
+        index = self._tick % len(self._slots)
+        slot = self._slots[index]
+        if not slot:
+            return []
+
+        due = []
+        pending = []
+        for deadline, entity in slot:
+            if deadline > self._tick:  # le falta otra vuelta
+                pending.append((deadline, entity))
+                continue
+            entry = self._deadlines.get(entity)
+            if entry is None or entry[0] != deadline:  # cancelado o reprogramado
+                continue
+            del self._deadlines[entity]
+            due.append((entity, entry[1]))
+        self._slots[index] = pending
+        return due
+
+    def __contains__(self, entity):
+        return entity in self._deadlines
+
+    def __len__(self):
+        return len(self._deadlines)
+
+
+class LifetimeReaper:
+    """
+    Decides when birds, explosions and debris must leave the game. Sprites
+    with a fixed lifetime are reaped when it runs out. The others are polled
+    every few ticks through a TimerWheel while they move: out of bounds
+    sprites are reaped right away and resting birds after a grace period.
+    Resting debris goes dormant and is only polled again after wake(), which
+    the game calls when something moving touches it, so the per-tick cost
+    follows the moving and expiring sprites, not all of them. on_expire(sprite, reason) does the actual removal.
+    """
+    def __init__(
+        self,
+        on_expire,
+        min_x: float,
+        max_x: float,
+        min_y: float,
+        ground_y: float = 30,
+        rest_speed: float = 5,
+        tick_rate: int = 60,
+        probe_time: float = 0.25,
+        grace_time: float = 2.0,
+        slots: int = 64,
+    ):
+        self.on_expire = on_expire
+        self.min_x = min_x
+        self.max_x = max_x
+        self.min_y = min_y
+        self.ground_y = ground_y
+        self.rest_speed = rest_speed
+        self.tick_rate = tick_rate
+        self.probe_ticks = self._ticks(probe_time)
+        self.grace_ticks = self._ticks(grace_time)
+        self.wheel = TimerWheel(slots)
+        self._can_rest = {}  # sprite -> si se elimina al quedarse quieto
+
+    def _ticks(self, seconds: float) -> int:
+        return max(1, round(seconds * self.tick_rate))
+
+    def track(self, sprite, lifetime: float = None, rest: bool = True, awake: bool = True):
+        """
+        Start tracking a sprite. With a lifetime (in seconds) the sprite is
+        reaped when it runs out; otherwise it is reaped when it leaves the
+        world or, if rest is True, when it stays on the ground or at rest.
+        Sprites with rest False go dormant while at rest, and start dormant
+        if awake is False
+        """
+        if lifetime is not None:
+            self.wheel.schedule(sprite, self._ticks(lifetime), EXPIRE)
+            return
+        self._can_rest[sprite] = rest
+        if awake:
+            self.wheel.schedule(sprite, self.probe_ticks, PROBE)
+
+    def wake(self, sprite):
+        """Resume polling a dormant sprite, e.g. after it was hit"""
+        if sprite in self._can_rest and sprite not in self.wheel:
+            self.wheel.schedule(sprite, self.probe_ticks, PROBE)
+
+    def forget(self, sprite):
+        self.wheel.cancel(sprite)
+        self._can_rest.pop(sprite, None)
+
+    def __len__(self):
+        return len(self.wheel)
+
+    def update(self):
+        """Advance one tick; call once per physics step"""
+        for sprite, action in self.wheel.advance():
+            if action == EXPIRE:
+                self._reap(sprite, "expired")
+                continue
+
+            body = sprite.body
+            if body.space is None:  # ya lo elimino otra parte (choque, bomba)
+                self._can_rest.pop(sprite, None)
+                continue
+
+            x, y = body.position
+            if x < self.min_x or x > self.max_x or y < self.min_y:
+                self._reap(sprite, "out of bounds")
+            elif not self._can_rest[sprite]:
+                if not self.is_still(body):  # escombro quieto: queda dormido
+                    self.wheel.schedule(sprite, self.probe_ticks, PROBE)
+            elif y <= self.ground_y or self.is_still(body):
+                if action == SETTLE:
+                    self._reap(sprite, "at rest")
+                else:
+                    self.wheel.schedule(sprite, self.grace_ticks, SETTLE)
+            else:
+                self.wheel.schedule(sprite, self.probe_ticks, PROBE)
+
+    def is_still(self, body) -> bool:
+        return body.is_sleeping or body.velocity.length < self.rest_speed
+
+    def _reap(self, sprite, reason: str):
+        self._can_rest.pop(sprite, None)
+        self.on_expire(sprite, reason)
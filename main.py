@@ -6,8 +6,11 @@ import random
 
 from game_object import RedBird, BlueBird, ChuckBird, BombBird, Column, Pig
 from game_logic import get_impulse_vector, Point2D, get_distance, ImpulseVector
+from lifetime import LifetimeReaper
+from entities import EntityStore, PIG, EXPLOSION
+from event_trace import EventTrace, LAUNCH, ABILITY, KILL, REMOVAL, LEVEL_END, REASONS
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.INFO)
 logging.getLogger("arcade").setLevel(logging.WARNING)
 logging.getLogger("pymunk").setLevel(logging.WARNING)
 logging.getLogger("PIL").setLevel(logging.WARNING)
@@ -21,16 +24,28 @@ GRAVITY = -900
 POINTS_PER_PIG = 500
 MAX_ATTEMPTS = 5
 HUD_COLOR = arcade.color.BLACK
+TRACE_PATH = "trace.bin"  # F12 o un error guardan aqui los eventos del juego
+WORLD_MARGIN = 200  # distancia fuera de la pantalla antes de eliminar un objeto
 
 
 class App(arcade.View):  # pantalla principal del juego
     def __init__(self):
         super().__init__()
         self.background = arcade.load_texture("assets/img/background3.png")
+        self.trace = EventTrace()
 
         # crear espacio de pymunk
         self.space = pymunk.Space()
         self.space.gravity = (0, GRAVITY)
+        self.space.sleep_time_threshold = 1.0  # cuerpos quietos se duermen
+        self.store = EntityStore()  # tipo y estado de las entidades de este juego
+
+        self.reaper = LifetimeReaper(
+            self.reap_sprite,
+            min_x=-WORLD_MARGIN,
+            max_x=WIDTH + WORLD_MARGIN,
+            min_y=-WORLD_MARGIN,
+        )
 
         # agregar piso
         floor_body = pymunk.Body(body_type=pymunk.Body.STATIC)
@@ -41,6 +56,7 @@ class App(arcade.View):  # pantalla principal del juego
         self.sprites = arcade.SpriteList()
         self.birds = arcade.SpriteList()
         self.world = arcade.SpriteList()
+        self.world_shapes = {}  # shape de pymunk -> sprite del mundo
         self.add_columns()
         self.add_pigs()
 
@@ -77,8 +93,6 @@ class App(arcade.View):  # pantalla principal del juego
         self.slingshot_texture = arcade.load_texture("assets/img/sling-3.png")
         self.update_preview_bird()
 
-        self.birds_to_remove = {}
-
         self.game_over = False
         self.won = False
         self.result_text = None
@@ -86,23 +100,57 @@ class App(arcade.View):  # pantalla principal del juego
 
     def collision_handler(self, arbiter, space, data):
         impulse_norm = arbiter.total_impulse.length
-        if impulse_norm < 100:
-            return True
-        if impulse_norm > 800:
-            for obj in list(self.world):
-                if obj.shape in arbiter.shapes:
-                    if isinstance(obj, Pig):
-                        self.score += POINTS_PER_PIG
-                        self.score_text.text = f"Score: {self.score}"
-                    obj.remove_from_sprite_lists()
-                    self.space.remove(obj.shape, obj.body)
+        shape_a, shape_b = arbiter.shapes
+        for shape, other in ((shape_a, shape_b), (shape_b, shape_a)):
+            obj = self.world_shapes.get(shape)
+            if obj is None:
+                continue
+            if impulse_norm <= 800:
+                # lo toca algo en movimiento (pajaro, cerdo rodando): puede caer fuera del mundo
+                if impulse_norm >= 100 or not self.reaper.is_still(other.body):
+                    self.reaper.wake(obj)
+                continue
+            self.trace.record(KILL, obj.entity.id, obj.entity.kind, obj.center_x, obj.center_y)
+            if obj.entity.kind == PIG:
+                self.score += POINTS_PER_PIG
+                self.score_text.text = f"Score: {self.score}"
+            obj.remove_from_sprite_lists()
+            self.space.remove(obj.shape, obj.body)
+            obj.entity.release()
+            self.reaper.forget(obj)
+            del self.world_shapes[shape]
+            # lo que estaba apoyado en el objeto destruido puede caer
+            self.wake_world(obj.body.position.x, obj.body.position.y, max(obj.width, obj.height))
         return True
 
+    def wake_world(self, x, y, radius):
+        # despierta los objetos del mundo cerca de una explosion o de un objeto destruido
+        for info in self.space.point_query((x, y), radius, pymunk.ShapeFilter()):
+            obj = self.world_shapes.get(info.shape)
+            if obj is not None:
+                self.reaper.wake(obj)
+
+    def reap_sprite(self, sprite, reason):
+        # llamado por el reaper cuando un objeto debe salir del juego
+        self.trace.record(
+            REMOVAL, sprite.entity.id, REASONS[reason], sprite.center_x, sprite.center_y
+        )
+        sprite.remove_from_sprite_lists()
+        if sprite.entity.kind == EXPLOSION:
+            sprite.entity.release()
+            return
+        self.world_shapes.pop(sprite.shape, None)
+        if sprite.body.space is not None:
+            self.space.remove(sprite.shape, sprite.body)
+        sprite.entity.release()
+
     def add_columns(self):
         for x in range(WIDTH // 2, WIDTH, 400):
-            column = Column(x, 50, self.space)
+            column = Column(x, 50, self.space, self.store)
             self.sprites.append(column)
             self.world.append(column)
+            self.world_shapes[column.shape] = column
+            self.reaper.track(column, rest=False, awake=False)
 
     def add_pigs(self):
         pig_positions = [
@@ -112,81 +160,46 @@ class App(arcade.View):  # pantalla principal del juego
             (WIDTH / 2 + 300, 200),
         ]
         for x, y in pig_positions:
-            pig = Pig(x, y, self.space)
+            pig = Pig(x, y, self.space, self.store)
             self.sprites.append(pig)
             self.world.append(pig)
+            self.world_shapes[pig.shape] = pig
+            self.reaper.track(pig, rest=False, awake=False)
 
     def on_update(self, delta_time: float):
         if self.game_over:
             return
+        self.trace.frame += 1
         self.space.step(1 / 60.0)
         self.update_collisions()
         self.sprites.update(delta_time)
         self._check_end_conditions()
     
         for sprite in self.sprites:
-            if hasattr(sprite, 'body'):
+            if sprite.entity.kind != EXPLOSION:
                 sprite.center_x = sprite.body.position.x
                 sprite.center_y = sprite.body.position.y
-                if hasattr(sprite, 'shape') and hasattr(sprite.shape, 'body'):
-                    sprite.angle = math.degrees(sprite.body.angle)
-    
-        for bird in self.birds:
-        # verifica si el pajaro tocó el piso
-            if hasattr(bird, 'body') and bird.body.position.y <= 30:
-                if bird not in self.birds_to_remove:
-                    logger.debug(f"Bird touched ground, will remove in 2 seconds: {bird.body.position}")
-                    self.birds_to_remove[bird] = 0.0
-                else:
-                    self.birds_to_remove[bird] += delta_time
-
-        # lista temporal para pajaros que deben ser eliminados 
-        birds_to_remove_now = []
-
-        for bird, elapsed_time in list(self.birds_to_remove.items()):
-            if elapsed_time >= 2.0:  # 2 segundos han pasado
-                birds_to_remove_now.append(bird)
-                # Remover del diccionario de seguimiento
-                del self.birds_to_remove[bird]
-
-    # eliminar pajaros que tocaron el piso
-        for bird in birds_to_remove_now:
-            logger.debug(f"Removing bird at position: {bird.body.position if hasattr(bird, 'body') else 'No body'}")
-        
-        # remover de las listas de sprites
-            if bird in self.sprites:
-                self.sprites.remove(bird)
-        
-        # remover de la lista de pajaros
-            if bird in self.birds:
-                self.birds.remove(bird)
-        
-        # remover del espacio de fisica 
-            if hasattr(bird, 'body') and hasattr(bird, 'shape'):
-                self.space.remove(bird.shape, bird.body)
-        
-        # si era el pajaro activo, actualizar la vista previa
-            if bird == self.active_bird:
-                self.active_bird = None
-                self.update_preview_bird()
+                sprite.angle = math.degrees(sprite.body.angle)
 
+        self.reaper.update()
 
     def update_collisions(self):
         pass
 
     def _remaining_pigs(self):
-        return [obj for obj in self.world if isinstance(obj, Pig)]
+        return self.store.count(PIG)
 
     def _check_end_conditions(self):
         pigs = self._remaining_pigs()
-        if len(pigs) == 0:
+        if pigs == 0:
             self._finish_game(won=True)
             return
-        if self.attempts_left == 0 and len(self.birds) == 0 and len(pigs) > 0:
+        if self.attempts_left == 0 and len(self.birds) == 0 and pigs > 0:
             self._finish_game(won=False)
     def _finish_game(self, won: bool):
         self.game_over = True
         self.won = won
+        self.trace.record(LEVEL_END, 0, int(won), self.score)
 
         if won:
             texture_path = "assets/img/ganaste.png"
@@ -221,6 +234,7 @@ class App(arcade.View):  # pantalla principal del juego
     def update_preview_bird(self):
         if self.preview_bird:
             self.preview_bird.remove_from_sprite_lists()
+            self.preview_bird.entity.release()
             self.preview_bird = None
             
         if self.current_bird_index < len(self.bird_queue):
@@ -229,10 +243,10 @@ class App(arcade.View):  # pantalla principal del juego
                 ImpulseVector(0, 0), 
                 self.slingshot_pos.x - 70,
                 self.slingshot_pos.y + 100, 
-                self.space
+                self.space,
+                self.store
             )
-            if hasattr(self.preview_bird, "body") and hasattr(self.preview_bird, "shape"):
-                self.space.remove(self.preview_bird.shape, self.preview_bird.body)
+            self.space.remove(self.preview_bird.shape, self.preview_bird.body)
             self.sprites.append(self.preview_bird)
 
     def on_mouse_press(self, x, y, button, modifiers):
@@ -262,13 +276,17 @@ class App(arcade.View):  # pantalla principal del juego
             self.draw_line = False
             
             impulse_vector = get_impulse_vector(self.slingshot_pos, self.end_point)
-            if hasattr(self.active_bird, "body") and hasattr(self.active_bird, "shape"):
-                self.space.add(self.active_bird.body, self.active_bird.shape)
+            self.space.add(self.active_bird.body, self.active_bird.shape)
             # apply impulse
-                self.active_bird.body.apply_impulse_at_local_point(
-                    (impulse_vector.impulse * math.cos(impulse_vector.angle) * 50,
-                    impulse_vector.impulse * math.sin(impulse_vector.angle) * 50)
-                )
+            self.active_bird.body.apply_impulse_at_local_point(
+                (impulse_vector.impulse * math.cos(impulse_vector.angle) * 50,
+                impulse_vector.impulse * math.sin(impulse_vector.angle) * 50)
+            )
+            self.reaper.track(self.active_bird)
+            self.trace.record(
+                LAUNCH, self.active_bird.entity.id, self.active_bird.entity.kind,
+                impulse_vector.angle, impulse_vector.impulse
+            )
             self.active_bird = None
             self.update_preview_bird()
             self.attempts_left = max(0, self.attempts_left - 1)
@@ -292,12 +310,26 @@ class App(arcade.View):  # pantalla principal del juego
 
 
     def on_key_press(self, key, modifiers):
+        if key == arcade.key.F12:
+            self.trace.dump(TRACE_PATH)
+            logger.info(f"Trace guardado en {TRACE_PATH}")
+            return
         if self.game_over:
             return
         if key == arcade.key.SPACE:
             for bird in self.birds:
-                if bird.has_special_ability and not bird.ability_used:
-                    bird.use_special_ability(self.space, self.sprites)
+                if bird.entity.has_special_ability and not bird.entity.ability_used:
+                    self.trace.record(
+                        ABILITY, bird.entity.id, bird.entity.kind, bird.center_x, bird.center_y
+                    )
+                    radius = bird.entity.explosion_radius
+                    # pajaros divididos y explosiones que agrego la habilidad
+                    for sprite in bird.use_special_ability(self.space, self.sprites):
+                        if sprite.entity.kind == EXPLOSION:
+                            self.reaper.track(sprite, lifetime=sprite.duration)
+                            self.wake_world(sprite.center_x, sprite.center_y, radius)
+                        else:
+                            self.reaper.track(sprite)
 
     def draw_trajectory(self, start_point, impulse_vector):
         if self.active_bird:
@@ -377,6 +409,7 @@ class App(arcade.View):  # pantalla principal del juego
 def main():
     window = arcade.Window(WIDTH, HEIGHT, TITLE)
     game = App()
+    game.trace.install_crash_dump(TRACE_PATH)
     window.show_view(game)
     arcade.run()
 
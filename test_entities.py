@@ -0,0 +1,60 @@
+import pytest
+
+from entities import EntityStore, BIRD, PIG, COLUMN
+
+
+def test_add_and_count():
+    store = EntityStore()
+    store.add(PIG)
+    store.add(PIG)
+    store.add(COLUMN)
+    assert store.count(PIG) == 2
+    assert store.count(COLUMN) == 1
+    assert len(store) == 3
+
+
+def test_flags_and_radius():
+    store = EntityStore()
+    entity = store.view(store.add(BIRD))
+    entity.has_special_ability = True
+    entity.ability_used = True
+    entity.ability_used = False
+    entity.explosion_radius = 150
+    assert entity.has_special_ability
+    assert not entity.ability_used
+    assert not entity.speed_boost_applied
+    assert entity.explosion_radius == 150
+
+
+def test_released_id_is_reused_with_fresh_state():
+    store = EntityStore()
+    old = store.view(store.add(BIRD, radius=150))
+    old.ability_used = True
+    old.release()
+    assert len(store) == 0
+    assert store.count(BIRD) == 0
+
+    new = store.view(store.add(PIG))
+    assert new.id == old.id
+    assert new.kind == PIG
+    assert not new.ability_used
+    assert new.explosion_radius == 0
+
+
+def test_stale_view_does_not_touch_reused_row():
+    store = EntityStore()
+    old = store.view(store.add(BIRD))
+    old.release()
+    new = store.view(store.add(PIG))
+
+    assert not old.alive
+    assert new.alive
+    with pytest.raises(LookupError):
+        old.kind
+    with pytest.raises(LookupError):
+        old.ability_used = True
+    assert not new.ability_used
+
+    old.release()  # liberar dos veces no libera la entidad nueva
+    assert new.alive
+    assert store.count(PIG) == 1
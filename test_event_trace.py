@@ -0,0 +1,72 @@
+import pytest
+
+from event_trace import EventTrace, read_trace, HEADER, KILL, LAUNCH, REMOVAL, MAGIC
+
+
+def fill(trace, count):
+    for i in range(count):
+        trace.frame = i
+        trace.record(KILL, i, 2, float(i), 0.0)
+
+
+def frames(records):
+    return [record[0] for record in records]
+
+
+def test_records_before_wrap(tmp_path):
+    trace = EventTrace(8)
+    fill(trace, 3)
+    path = tmp_path / "trace.bin"
+    trace.dump(path)
+    assert frames(read_trace(path)) == [0, 1, 2]
+
+
+def test_dump_order_after_wrap(tmp_path):
+    trace = EventTrace(8)
+    fill(trace, 11)
+    path = tmp_path / "trace.bin"
+    trace.dump(path)
+    events = read_trace(path)
+    assert frames(events) == list(range(3, 11))
+    assert events == trace.records()
+
+
+def test_dump_exactly_full(tmp_path):
+    trace = EventTrace(8)
+    fill(trace, 16)
+    path = tmp_path / "trace.bin"
+    trace.dump(path)
+    assert frames(read_trace(path)) == list(range(8, 16))
+
+
+def test_large_entity_ids_round_trip(tmp_path):
+    trace = EventTrace(4)
+    trace.record(LAUNCH, 70000, 1, 0.5, 80.0)
+    trace.record(REMOVAL, 4_000_000_000, 2, 1.0, 2.0)
+    path = tmp_path / "trace.bin"
+    trace.dump(path)
+    events = read_trace(path)
+    assert [(e[2], e[3], e[4]) for e in events] == [(LAUNCH, 70000, 1), (REMOVAL, 4_000_000_000, 2)]
+
+
+def test_rejects_bad_header(tmp_path):
+    path = tmp_path / "trace.bin"
+    path.write_bytes(HEADER.pack(b"NOPE", 26, 0))
+    with pytest.raises(ValueError):
+        read_trace(path)
+    path.write_bytes(HEADER.pack(MAGIC, 12, 0))
+    with pytest.raises(ValueError):
+        read_trace(path)
+    path.write_bytes(b"AB")
+    with pytest.raises(ValueError):
+        read_trace(path)
+
+
+def test_rejects_truncated_dump(tmp_path):
+    trace = EventTrace(8)
+    fill(trace, 5)
+    path = tmp_path / "trace.bin"
+    trace.dump(path)
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        read_trace(path)
@@ -0,0 +1,144 @@
+from lifetime import TimerWheel, LifetimeReaper, PROBE, SETTLE
+
+
+class Vec(tuple):
+    @property
+    def length(self):
+        return (self[0] ** 2 + self[1] ** 2) ** 0.5
+
+
+class FakeBody:
+    def __init__(self, position, velocity=(0, 0)):
+        self.position = Vec(position)
+        self.velocity = Vec(velocity)
+        self.space = object()
+        self.is_sleeping = False
+
+
+class FakeSprite:
+    def __init__(self, position, velocity=(0, 0)):
+        self.body = FakeBody(position, velocity)
+
+
+def advance(wheel, ticks):
+    due = []
+    for _ in range(ticks):
+        due.extend(wheel.advance())
+    return due
+
+
+def make_reaper():
+    reaped = []
+    reaper = LifetimeReaper(
+        lambda sprite, reason: reaped.append((sprite, reason)),
+        min_x=-200, max_x=2000, min_y=-200,
+    )
+    return reaper, reaped
+
+
+def test_wheel_fires_on_deadline():
+    wheel = TimerWheel(8)
+    wheel.schedule("a", 3, PROBE)
+    assert advance(wheel, 2) == []
+    assert wheel.advance() == [("a", PROBE)]
+    assert "a" not in wheel
+
+
+def test_wheel_delay_longer_than_slots():
+    wheel = TimerWheel(8)
+    wheel.schedule("a", 20, PROBE)
+    assert advance(wheel, 19) == []
+    assert wheel.advance() == [("a", PROBE)]
+
+
+def test_wheel_cancel_and_reschedule_drop_stale_entries():
+    wheel = TimerWheel(8)
+    wheel.schedule("a", 2, PROBE)
+    wheel.schedule("b", 2, PROBE)
+    wheel.cancel("a")
+    wheel.schedule("b", 5, SETTLE)
+    assert advance(wheel, 4) == []
+    assert wheel.advance() == [("b", SETTLE)]
+    assert len(wheel) == 0
+
+
+def test_out_of_bounds_is_reaped_on_first_probe():
+    reaper, reaped = make_reaper()
+    sprite = FakeSprite((3000, 100))
+    reaper.track(sprite)
+    for _ in range(reaper.probe_ticks):
+        reaper.update()
+    assert reaped == [(sprite, "out of bounds")]
+
+
+def test_grounded_bird_reaped_after_grace():
+    reaper, reaped = make_reaper()
+    bird = FakeSprite((100, 20), (50, 0))
+    reaper.track(bird)
+    for _ in range(reaper.probe_ticks + reaper.grace_ticks - 1):
+        reaper.update()
+    assert reaped == []
+    reaper.update()
+    assert reaped == [(bird, "at rest")]
+
+
+def test_flying_bird_keeps_being_probed():
+    reaper, reaped = make_reaper()
+    bird = FakeSprite((500, 300), (300, 300))
+    reaper.track(bird)
+    for _ in range(300):
+        reaper.update()
+    assert reaped == []
+    assert bird in reaper.wheel
+
+
+def test_still_debris_goes_dormant_until_woken():
+    reaper, reaped = make_reaper()
+    pig = FakeSprite((900, 100))
+    reaper.track(pig, rest=False)
+    for _ in range(reaper.probe_ticks):
+        reaper.update()
+    assert len(reaper) == 0
+
+    pig.body.position = Vec((2500, 0))
+    for _ in range(100):
+        reaper.update()
+    assert reaped == []
+
+    reaper.wake(pig)
+    for _ in range(reaper.probe_ticks):
+        reaper.update()
+    assert reaped == [(pig, "out of bounds")]
+
+
+def test_moving_debris_is_polled_until_it_leaves_the_world():
+    reaper, reaped = make_reaper()
+    pig = FakeSprite((1790, 100), (100, 0))
+    reaper.track(pig, rest=False)
+    for _ in range(reaper.probe_ticks * 2):
+        reaper.update()
+    assert reaped == []
+    pig.body.position = Vec((1900, -300))
+    for _ in range(reaper.probe_ticks):
+        reaper.update()
+    assert reaped == [(pig, "out of bounds")]
+
+
+def test_fixed_lifetime_expires():
+    reaper, reaped = make_reaper()
+    explosion = object()
+    reaper.track(explosion, lifetime=0.5)
+    for _ in range(30):
+        reaper.update()
+    assert reaped == [(explosion, "expired")]
+
+
+def test_sprite_removed_elsewhere_is_dropped():
+    reaper, reaped = make_reaper()
+    bird = FakeSprite((100, 20))
+    reaper.track(bird)
+    bird.body.space = None
+    for _ in range(reaper.probe_ticks):
+        reaper.update()
+    assert reaped == []
+    assert len(reaper) == 0